@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     def maps_api_key(self) -> str:
         return self.google_maps_api_key
 
+    # Solar API cache persisted across restarts (empty disables persistence)
+    solar_cache_path: str = ""
+
     # Azure Cosmos DB
     cosmos_endpoint: str = "https://acidni-cosmos-dev.documents.azure.com:443/"
     cosmos_database: str = "gridsight-dev"
@@ -48,11 +51,20 @@ class Settings(BaseSettings):
     # Application Insights
     applicationinsights_connection_string: str = ""
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
+    )
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached application settings."""
+    """Get cached application settings.
+
+    Always use this instead of constructing ``Settings`` directly so ``.env``
+    is read once per process. Set ``SKIP_DOTENV`` when the environment is
+    injected directly (e.g. in containers) to skip the file entirely.
+    """
+    if os.environ.get("SKIP_DOTENV"):
+        return Settings(_env_file=None)  # type: ignore[call-arg]
     return Settings()
 
@@ -6,16 +6,24 @@ Google Gemini, Maps, and Solar APIs.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
 from src.config import get_settings
 from src.routes import energy, health, layouts, parcels, visualize
+from src.services import (
+    close_services,
+    get_gemini_service,
+    get_solar_service,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,9 +32,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _skip_probe_access_logs(record: logging.LogRecord) -> bool:
+    """Drop uvicorn access-log lines for health probes, which fire every few seconds."""
+    args = record.args
+    return not (isinstance(args, tuple) and len(args) > 2 and str(args[2]).startswith("/health"))
+
+
+logging.getLogger("uvicorn.access").addFilter(_skip_probe_access_logs)
+
 APP_VERSION = "v20260209-1"
 
 
+class _JSONGZipMiddleware(GZipMiddleware):
+    """GZip middleware that skips routes returning already-compressed images."""
+
+    SKIP_PATH_PREFIXES = ("/api/v1/visualize",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.SKIP_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+async def _warm_services(app: FastAPI) -> None:
+    """Build service singletons after startup and mark the app ready.
+
+    Construction imports the Google SDKs and builds their clients, so it runs
+    in a worker thread to keep the event loop free for health probes. Routes
+    fetch the same singletons through the getters.
+    """
+    for name, getter in (
+        ("solar_service", get_solar_service),
+        ("gemini_service", get_gemini_service),
+    ):
+        try:
+            await asyncio.to_thread(getter)
+        except Exception as e:
+            logger.warning("Could not initialize %s: %s", name, e)
+
+    app.state.ready = True
+    logger.info("Services warmed, ready to serve requests")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application startup and shutdown lifecycle."""
@@ -40,11 +89,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Solar API: %s", "configured" if settings.solar_api_key else "NOT SET")
     logger.info("Maps API: %s", "configured" if settings.maps_api_key else "NOT SET")
 
+    app.state.ready = False
+    warmup = asyncio.create_task(_warm_services(app))
+
     yield
 
     logger.info("GridSight SitePlanner shutting down")
+    app.state.ready = False
+    warmup.cancel()
+    await close_services()
 
 
+# No default_response_class: since FastAPI 0.130, routes with a return type are
+# serialized straight to JSON bytes by Pydantic's Rust core, which is faster
+# than ORJSONResponse (now deprecated) and skips the intermediate dict.
 app = FastAPI(
     title="GridSight SitePlanner",
     description=(
@@ -59,17 +117,21 @@ app = FastAPI(
 # CORS — allow GridSight frontends
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=(
         "https://gridsight.acidni.net",
         "https://gridsight-dev.acidni.net",
         "http://localhost:3000",
         "http://localhost:5173",
-    ],
+    ),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type", "X-Requested-With"),
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
+# Compress multi-KB JSON payloads (parcel analysis, energy estimates, layouts)
+app.add_middleware(_JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount routes
 app.include_router(health.router)
 app.include_router(parcels.router)
@@ -97,7 +159,9 @@ if __name__ == "__main__":
     settings = get_settings()
     uvicorn.run(
         "src.main:app",
-        host="0.0.0.0",
+        host=settings.host,
         port=settings.port,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
     )
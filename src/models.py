@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from enum import Enum
+from datetime import UTC, datetime
+from enum import StrEnum
+from functools import partial
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # ─── Enums ─────────────────────────────────────────────────────────────────────
 
 
-class StructureType(str, Enum):
+class StructureType(StrEnum):
     """Types of structures that can be placed on a site."""
 
     HOME = "home"
@@ -29,7 +30,7 @@ class StructureType(str, Enum):
     BARN = "barn"
 
 
-class EfficiencyLevel(str, Enum):
+class EfficiencyLevel(StrEnum):
     """Building energy efficiency level."""
 
     EFFICIENT = "efficient"
@@ -37,7 +38,7 @@ class EfficiencyLevel(str, Enum):
     POOR = "poor"
 
 
-class ProjectStatus(str, Enum):
+class ProjectStatus(StrEnum):
     """Status of a site planning project."""
 
     CREATED = "created"
@@ -48,17 +49,35 @@ class ProjectStatus(str, Enum):
     FAILED = "failed"
 
 
+# ─── Defaults ──────────────────────────────────────────────────────────────────
+
+# Mutable field defaults are copied from these constants via C-level callables
+# (``list``, ``dict.copy``) rather than rebuilt by a lambda per instance.
+_DEFAULT_STRUCTURES: tuple[StructureType, ...] = (StructureType.HOME,)
+_DEFAULT_SETBACKS: dict[str, float] = {"front_ft": 25, "side_ft": 10, "rear_ft": 20}
+
+# Request bodies are parsed once and never mutated; reject unknown fields early
+_REQUEST_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
+
+def _now() -> datetime:
+    """Current time as an aware UTC datetime (replaces deprecated ``utcnow``)."""
+    return datetime.now(UTC)
+
+
 # ─── Request Models ────────────────────────────────────────────────────────────
 
 
 class ParcelAnalyzeRequest(BaseModel):
     """Request to analyze a parcel of land."""
 
+    model_config = _REQUEST_CONFIG
+
     address: str = Field(..., description="Street address of the parcel")
     lat: float | None = Field(None, description="Latitude (optional if address provided)")
     lng: float | None = Field(None, description="Longitude (optional if address provided)")
     desired_structures: list[StructureType] = Field(
-        default_factory=lambda: [StructureType.HOME],
+        default_factory=partial(list, _DEFAULT_STRUCTURES),
         description="List of structures to place on the site",
     )
     home_sqft: int = Field(2400, ge=500, le=20000, description="Home living area in sqft")
@@ -75,13 +94,15 @@ class ParcelAnalyzeRequest(BaseModel):
 class LayoutGenerateRequest(BaseModel):
     """Request to generate or regenerate a site layout."""
 
+    model_config = _REQUEST_CONFIG
+
     project_id: str = Field("", description="Project ID from parcel analysis")
     user_id: str = Field("default-user", description="User ID for project ownership")
     parcel_sqft: float = Field(10000, ge=500, description="Total parcel area in sqft")
     parcel_width_ft: float = Field(100, ge=10, description="Parcel width in feet")
     parcel_depth_ft: float = Field(100, ge=10, description="Parcel depth in feet")
     structures: list[StructureType] = Field(
-        default_factory=lambda: [StructureType.HOME],
+        default_factory=partial(list, _DEFAULT_STRUCTURES),
         description="Structures to place on the site",
     )
     constraints: dict[str, str] = Field(
@@ -95,6 +116,8 @@ class LayoutGenerateRequest(BaseModel):
 class EnergyEstimateRequest(BaseModel):
     """Request to estimate energy usage for a site."""
 
+    model_config = _REQUEST_CONFIG
+
     lat: float = Field(..., description="Latitude of the site")
     lng: float = Field(..., description="Longitude of the site")
     home_sqft: int = Field(2400, ge=500, le=20000, description="Home living area in sqft")
@@ -107,6 +130,8 @@ class EnergyEstimateRequest(BaseModel):
 class VisualizeRequest(BaseModel):
     """Request to generate a visualization of the site layout."""
 
+    model_config = _REQUEST_CONFIG
+
     project_id: str = Field("", description="Project ID with completed layout")
     layout_id: str = Field("", description="Layout ID for visualization reference")
     layout_description: str = Field("", description="Text description of the layout for rendering")
@@ -151,7 +176,7 @@ class ParcelFeatures(BaseModel):
         default_factory=dict, description="width_ft, depth_ft"
     )
     setback_estimate: dict[str, float] = Field(
-        default_factory=lambda: {"front_ft": 25, "side_ft": 10, "rear_ft": 20}
+        default_factory=_DEFAULT_SETBACKS.copy
     )
 
 
@@ -174,7 +199,7 @@ class ParcelAnalysisResult(BaseModel):
     parcel_features: ParcelFeatures
     context_data: ContextData
     satellite_image_url: str = ""
-    analysis_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    analysis_timestamp: datetime = Field(default_factory=_now)
 
 
 # ─── Layout Models ────────────────────────────────────────────────────────────
@@ -199,7 +224,7 @@ class SiteLayout(BaseModel):
     layout_id: str = ""
     structures: list[PlacedStructure] = Field(default_factory=list)
     setbacks: dict[str, float] = Field(
-        default_factory=lambda: {"front_ft": 25, "side_ft": 10, "rear_ft": 20}
+        default_factory=_DEFAULT_SETBACKS.copy
     )
     lot_coverage_pct: float = 0.0
     usable_yard_sqft: float = 0.0
@@ -283,8 +308,8 @@ class ProjectResponse(BaseModel):
     layout: SiteLayout | None = None
     energy_estimate: EnergyEstimateResult | None = None
     visualizations: list[str] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
 
 
 class StructureTemplate(BaseModel):
@@ -299,3 +324,11 @@ class StructureTemplate(BaseModel):
     requires_setback: bool = False
     default_setback_ft: float = 0.0
     variants: list[str] = Field(default_factory=list)
+
+
+# ─── Adapters ──────────────────────────────────────────────────────────────────
+
+# Validates a whole Gemini layout payload in a single pydantic-core call
+PLACED_STRUCTURES_ADAPTER: TypeAdapter[list[PlacedStructure]] = TypeAdapter(
+    list[PlacedStructure]
+)
@@ -11,14 +11,13 @@ from src.models import (
     EnergyEstimateResult,
     SolarPotential,
 )
-from src.services.energy_service import EnergyService
-from src.services.solar_service import SolarService
+from src.services import energy_service, get_solar_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/energy", tags=["energy"])
 
 
-@router.post("/estimate", response_model=EnergyEstimateResult)
+@router.post("/estimate")
 async def estimate_energy(request: EnergyEstimateRequest) -> EnergyEstimateResult:
     """Estimate monthly and yearly energy usage for structures.
 
@@ -37,8 +36,7 @@ async def estimate_energy(request: EnergyEstimateRequest) -> EnergyEstimateResul
     )
 
     try:
-        energy_svc = EnergyService()
-        solar_svc = SolarService()
+        solar_svc = get_solar_service()
 
         # Calculate energy estimate
         cooled_sqft = request.cooling_sqft or request.home_sqft
@@ -46,7 +44,7 @@ async def estimate_energy(request: EnergyEstimateRequest) -> EnergyEstimateResul
         if request.include_solar:
             solar = await solar_svc.get_solar_potential(request.lat, request.lng)
 
-        result = energy_svc.estimate(
+        result = energy_service.estimate(
             home_sqft=request.home_sqft,
             cooling_sqft=cooled_sqft,
             lat=request.lat,
@@ -63,7 +61,7 @@ async def estimate_energy(request: EnergyEstimateRequest) -> EnergyEstimateResul
         ) from e
 
 
-@router.get("/solar/{lat}/{lng}", response_model=SolarPotential)
+@router.get("/solar/{lat}/{lng}")
 async def get_solar_potential(lat: float, lng: float) -> SolarPotential:
     """Get solar energy potential for a specific location.
 
@@ -76,7 +74,7 @@ async def get_solar_potential(lat: float, lng: float) -> SolarPotential:
     logger.info("Solar lookup: (%.4f, %.4f)", lat, lng)
 
     try:
-        solar_svc = SolarService()
+        solar_svc = get_solar_service()
         result = await solar_svc.get_solar_potential(lat, lng)
         return result
 
@@ -1,25 +1,57 @@
-"""Health check route."""
+"""Health check routes.
+
+``/health`` is the liveness probe and ``/health/ready`` the readiness probe,
+which reflects service warmup. Probe bodies never change for the life of the
+process apart from the ready flag, so each variant is serialized once at import
+and served as raw bytes. ``timestamp`` is the process start time.
+"""
 
 from __future__ import annotations
 
 import datetime as dt
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 
 from src.config import get_settings
 from src.models import HealthResponse
 
 router = APIRouter(tags=["health"])
 
+_settings = get_settings()
+_STARTED_AT = dt.datetime.now(dt.UTC).isoformat()
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """Return service health status with version info."""
-    settings = get_settings()
-    return HealthResponse(
-        status="healthy",
-        service=settings.app_name,
-        version=settings.app_version,
-        environment=settings.environment,
-        timestamp=dt.datetime.now(dt.UTC).isoformat(),
+
+def _encode(status: str) -> bytes:
+    return orjson.dumps(
+        HealthResponse(
+            status=status,
+            service=_settings.app_name,
+            version=_settings.app_version,
+            environment=_settings.environment,
+            timestamp=_STARTED_AT,
+        ).model_dump()
     )
+
+
+_LIVE_BODY = _encode("healthy")
+_READY_BODY = _encode("ready")
+_STARTING_BODY = _encode("starting")
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
+    """Return service health status with version info."""
+    return Response(content=_LIVE_BODY, media_type="application/json")
+
+
+@router.get(
+    "/health/ready",
+    responses={200: {"model": HealthResponse}, 503: {"model": HealthResponse}},
+)
+async def readiness_check(request: Request) -> Response:
+    """Return 200 once service singletons are warmed, 503 until then."""
+    if getattr(request.app.state, "ready", False):
+        return Response(content=_READY_BODY, media_type="application/json")
+    return Response(content=_STARTING_BODY, status_code=503, media_type="application/json")
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
 
 from src.models import (
     ContextData,
@@ -14,13 +17,13 @@ from src.models import (
     StructureTemplate,
     StructureType,
 )
-from src.services.gemini_service import GeminiService
+from src.services import get_gemini_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/layouts", tags=["layouts"])
 
 # Pre-defined structure templates with typical sizes
-STRUCTURE_TEMPLATES: list[StructureTemplate] = [
+STRUCTURE_TEMPLATES: tuple[StructureTemplate, ...] = (
     StructureTemplate(
         type=StructureType.HOME,
         name="Single Family Home",
@@ -121,16 +124,38 @@ STRUCTURE_TEMPLATES: list[StructureTemplate] = [
         requires_setback=True,
         default_setback_ft=10.0,
     ),
-]
+)
+
+# O(1) template lookup by structure type
+TEMPLATES_BY_TYPE: dict[StructureType, StructureTemplate] = {
+    t.type: t for t in STRUCTURE_TEMPLATES
+}
+
 
+# Templates never change at runtime, so encode them (and their ETag) once. The
+# tag is weak because GZipMiddleware may send the same body gzip-encoded.
+_TEMPLATES_BODY = orjson.dumps([t.model_dump(mode="json") for t in STRUCTURE_TEMPLATES])
+_TEMPLATES_OPAQUE_TAG = f'"{hashlib.sha256(_TEMPLATES_BODY).hexdigest()[:32]}"'
+_TEMPLATES_ETAG = f"W/{_TEMPLATES_OPAQUE_TAG}"
 
-@router.get("/templates", response_model=list[StructureTemplate])
-async def get_templates() -> list[StructureTemplate]:
-    """Return all available structure templates with defaults."""
-    return STRUCTURE_TEMPLATES
+
+@router.get("/templates", responses={200: {"model": list[StructureTemplate]}})
+async def get_templates(if_none_match: str | None = Header(None)) -> Response:
+    """Return all available structure templates with defaults.
+
+    Responds 304 when the client already holds the current ETag.
+    """
+    headers = {"ETag": _TEMPLATES_ETAG}
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or _TEMPLATES_OPAQUE_TAG
+        in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_TEMPLATES_BODY, media_type="application/json", headers=headers)
 
 
-@router.post("/generate", response_model=SiteLayout)
+@router.post("/generate")
 async def generate_layout(request: LayoutGenerateRequest) -> SiteLayout:
     """Generate an optimized site layout using Gemini AI.
 
@@ -145,7 +170,7 @@ async def generate_layout(request: LayoutGenerateRequest) -> SiteLayout:
     )
 
     try:
-        gemini = GeminiService()
+        gemini = get_gemini_service()
 
         # Build parcel features from request dimensions
         parcel_features = ParcelFeatures(
@@ -173,7 +198,7 @@ async def generate_layout(request: LayoutGenerateRequest) -> SiteLayout:
         ) from e
 
 
-@router.post("/{layout_id}/adjust", response_model=SiteLayout)
+@router.post("/{layout_id}/adjust")
 async def adjust_layout(layout_id: str, request: LayoutGenerateRequest) -> SiteLayout:
     """Adjust an existing layout with modified structure placement.
 
@@ -183,7 +208,7 @@ async def adjust_layout(layout_id: str, request: LayoutGenerateRequest) -> SiteL
     logger.info("Adjusting layout %s", layout_id)
 
     try:
-        gemini = GeminiService()
+        gemini = get_gemini_service()
 
         parcel_features = ParcelFeatures(
             usable_area_sqft=request.parcel_sqft,
@@ -3,53 +3,43 @@
 from __future__ import annotations
 
 import logging
-import uuid
+import secrets
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
 
 from src.models import (
     ParcelAnalyzeRequest,
     ProjectResponse,
     ProjectStatus,
 )
-from src.services.gemini_service import GeminiService
+from src.services import get_gemini_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/parcels", tags=["parcels"])
 
 
-@router.post("/analyze", response_model=ProjectResponse)
+@router.post("/analyze")
 async def analyze_parcel(request: ParcelAnalyzeRequest) -> ProjectResponse:
     """Analyze a parcel of land using satellite imagery and Gemini AI.
 
     Steps:
-    1. Fetch satellite imagery from Google Maps Static API
-    2. Analyze image with Gemini 2.5 Flash (object detection, boundaries)
-    3. Get location context via Gemini Maps Grounding (zoning, climate)
-    4. Return parcel analysis with features and context
+    1. Fetch satellite imagery from Google Maps Static API and analyze it
+       with Gemini 2.5 Flash (object detection, boundaries), while
+       concurrently getting location context via Gemini Maps Grounding
+       (zoning, climate)
+    2. Return parcel analysis with features and context
     """
-    project_id = f"proj_{uuid.uuid4().hex[:12]}"
+    project_id = f"proj_{secrets.token_hex(6)}"
     logger.info("Starting parcel analysis: %s -> %s", request.address, project_id)
 
     try:
-        gemini = GeminiService()
+        gemini = get_gemini_service()
 
         # Get coordinates (use provided or geocode would go here)
         lat = request.lat or 29.7147  # Default to Hastings FL
         lng = request.lng or -81.5036
 
-        # Step 1: Get satellite image
-        satellite_image = await gemini.get_satellite_image(lat, lng, zoom=20)
-        logger.info("Satellite image acquired: %d bytes", len(satellite_image))
-
-        # Step 2 & 3: Analyze parcel with Gemini
-        analysis = await gemini.analyze_parcel(
-            satellite_image=satellite_image,
-            address=request.address,
-            lat=lat,
-            lng=lng,
-        )
+        analysis = await gemini.analyze_parcel(request.address, lat, lng)
 
         return ProjectResponse(
             id=project_id,
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import Response
 
 from src.models import VisualizeRequest
-from src.services.gemini_service import GeminiService
+from src.services import get_gemini_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/visualize", tags=["visualize"])
@@ -22,7 +22,10 @@ async def generate_visualization(request: VisualizeRequest) -> Response:
     rendered view of the proposed layout overlaid on the
     satellite imagery of the actual parcel.
 
-    Returns PNG image bytes with appropriate content type.
+    Returns PNG image bytes with appropriate content type. The response is
+    deliberately not streamed: Gemini delivers the image as a single inline
+    part, and whether one was produced (200 vs 422) must be known before any
+    bytes are sent. ``Response`` sends the SDK's buffer as-is, without a copy.
     """
     logger.info(
         "Generating visualization for layout %s, style=%s",
@@ -31,7 +34,7 @@ async def generate_visualization(request: VisualizeRequest) -> Response:
     )
 
     try:
-        gemini = GeminiService()
+        gemini = get_gemini_service()
 
         image_bytes = await gemini.generate_visualization(
             address=request.address,
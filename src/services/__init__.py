@@ -1 +1,59 @@
-"""Services package for GridSight SitePlanner."""
+"""Services package for GridSight SitePlanner.
+
+Service instances are process-wide singletons built on first use, so their
+API clients and connection pools are shared across requests. Service modules
+are imported inside the getters to keep ``import src.main`` cheap.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.services.gemini_service import GeminiService
+    from src.services.solar_service import SolarService
+
+# Startup warms the services in a worker thread while requests may already be
+# calling the getters on the event loop; lru_cache alone would let both build.
+_build_lock = threading.Lock()
+
+
+def get_solar_service() -> SolarService:
+    """Get the shared Google Solar API service."""
+    with _build_lock:
+        return _build_solar_service()
+
+
+def get_gemini_service() -> GeminiService:
+    """Get the shared Gemini AI service."""
+    with _build_lock:
+        return _build_gemini_service()
+
+
+@lru_cache
+def _build_solar_service() -> SolarService:
+    from src.services.solar_service import SolarService
+
+    return SolarService()
+
+
+@lru_cache
+def _build_gemini_service() -> GeminiService:
+    from src.services.gemini_service import GeminiService
+
+    return GeminiService()
+
+
+async def close_services() -> None:
+    """Close service singletons that were created and the shared HTTP client."""
+    from src.services import _http
+
+    if _build_solar_service.cache_info().currsize:
+        await _build_solar_service().aclose()
+        _build_solar_service.cache_clear()
+    if _build_gemini_service.cache_info().currsize:
+        await _build_gemini_service().aclose()
+        _build_gemini_service.cache_clear()
+    await _http.aclose()
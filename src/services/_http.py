@@ -0,0 +1,32 @@
+"""Process-wide HTTP client shared by the Google API services.
+
+One pooled client means Solar and Maps calls reuse warm TCP/TLS (and HTTP/2)
+connections instead of handshaking per service. It is created on first use
+and closed at shutdown by :func:`src.services.close_services`.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it if needed."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _CLIENT
+
+
+async def aclose() -> None:
+    """Close the shared client if it was created."""
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,27 @@
+"""Request coalescing for concurrent identical upstream calls.
+
+While a call for ``key`` is in flight, further callers with the same key
+await that call's result instead of issuing their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+async def do[T](key: Hashable, coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run ``coro_factory()`` once per in-flight ``key`` and share its result.
+
+    The shared call is shielded, so one waiter being cancelled does not
+    cancel it for the others.
+    """
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(coro_factory())
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(future)
@@ -0,0 +1,58 @@
+"""Size-bounded LRU cache whose entries expire after a fixed age.
+
+Values are stored as-is; caches holding mutable models hand callers copies.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+
+
+class TTLCache[K: Hashable, V]:
+    """LRU mapping of keys to timestamped values.
+
+    Entries older than ``ttl`` seconds count as expired, and inserts beyond
+    ``maxsize`` evict the least recently used entry. ``clock`` defaults to
+    ``time.monotonic``; pass ``time.time`` when timestamps outlive the process.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_clock", "_entries")
+
+    def __init__(
+        self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K) -> tuple[V, bool] | None:
+        """Return ``(value, expired)`` for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        stored_at, value = entry
+        return value, self._clock() - stored_at >= self.ttl
+
+    def get(self, key: K) -> V | None:
+        """Return the unexpired value for ``key``, or ``None``."""
+        hit = self.lookup(key)
+        return None if hit is None or hit[1] else hit[0]
+
+    def set(self, key: K, value: V, stored_at: float | None = None) -> None:
+        """Store ``value`` as the most recently used entry, evicting the oldest."""
+        self._entries[key] = (self._clock() if stored_at is None else stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def items(self) -> Iterator[tuple[K, float, V]]:
+        """Yield ``(key, stored_at, value)`` from least to most recently used."""
+        for key, (stored_at, value) in self._entries.items():
+            yield key, stored_at, value
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from src.models import (
     EfficiencyLevel,
-    EnergyAssumptions,
     EnergyEstimateResult,
-    MonthlyEnergy,
     SolarPotential,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # ─── Climate Zone Data ─────────────────────────────────────────────────────────
@@ -32,12 +36,37 @@ MONTHLY_HDD_FACTORS = {
 
 MONTH_NAMES = list(MONTHLY_CDD_FACTORS.keys())
 
-# Climate zone lookup by approximate ZIP code ranges (Florida-focused)
-CLIMATE_ZONES: dict[str, dict] = {
-    "1A": {"cdd": 4000, "hdd": 200, "rate": 0.14, "description": "Hot-Humid (South FL)"},
-    "2A": {"cdd": 2800, "hdd": 1200, "rate": 0.13, "description": "Hot-Humid (Central/North FL)"},
-    "3A": {"cdd": 2000, "hdd": 2000, "rate": 0.12, "description": "Warm-Humid (Panhandle)"},
-}
+# (month, cdd_factor, hdd_factor) rows in calendar order, so the monthly
+# breakdown is a single pass with no per-month dict lookups
+_MONTHLY_FACTORS: tuple[tuple[str, float, float], ...] = tuple(
+    (month, MONTHLY_CDD_FACTORS[month], MONTHLY_HDD_FACTORS[month]) for month in MONTH_NAMES
+)
+
+
+class ClimateZone(NamedTuple):
+    """IECC climate zone parameters."""
+
+    id: str
+    cdd: int
+    hdd: int
+    rate: float
+    description: str
+
+
+# Climate zones from south to north (Florida-focused), indexed by
+# climate_zone_index()
+CLIMATE_ZONES: tuple[ClimateZone, ...] = (
+    # South Florida (Miami, Fort Lauderdale)
+    ClimateZone("1A", 4000, 200, 0.14, "Hot-Humid (South FL)"),
+    # Central/North Florida (Orlando, Jacksonville, Hastings)
+    ClimateZone("2A", 2800, 1200, 0.13, "Hot-Humid (Central/North FL)"),
+    # Florida Panhandle (Pensacola, Tallahassee)
+    ClimateZone("3A", 2000, 2000, 0.12, "Warm-Humid (Panhandle)"),
+)
+
+# Latitude boundaries between zones; a zone applies from its lower bound up to
+# (but excluding) the next one
+_ZONE_LAT_BOUNDS = (26.5, 30.5)
 
 # Efficiency factors for cooling and heating
 EFFICIENCY_FACTORS = {
@@ -46,107 +75,204 @@ EFFICIENCY_FACTORS = {
     EfficiencyLevel.POOR: {"cooling": 0.70, "heating": 0.40, "base": 4.5},
 }
 
+# Per efficiency level (base, cooling, heating) factors, unpacked in one lookup.
+# Loads are evaluated as sqft × degree days × factor / 1000, in the model's
+# order; folding degree days and /1000 into one coefficient changes rounding.
+_EFFICIENCY_COEFFICIENTS: dict[EfficiencyLevel, tuple[float, float, float]] = {
+    efficiency: (factors["base"], factors["cooling"], factors["heating"])
+    for efficiency, factors in EFFICIENCY_FACTORS.items()
+}
+
+
+def climate_zone_index(lat: float) -> int:
+    """Return the position in ``CLIMATE_ZONES`` of the zone for a latitude."""
+    return bisect.bisect_right(_ZONE_LAT_BOUNDS, lat)
+
 
 def get_climate_zone(lat: float) -> str:
     """Determine IECC climate zone from latitude (Florida-focused)."""
-    if lat < 26.5:
-        return "1A"  # South Florida (Miami, Fort Lauderdale)
-    elif lat < 30.5:
-        return "2A"  # Central/North Florida (Orlando, Jacksonville, Hastings)
-    else:
-        return "3A"  # Florida Panhandle (Pensacola, Tallahassee)
-
-
-class EnergyService:
-    """Service for estimating residential energy usage."""
-
-    def estimate(
-        self,
-        home_sqft: int,
-        cooling_sqft: int | None,
-        lat: float,
-        efficiency: EfficiencyLevel = EfficiencyLevel.STANDARD,
-        solar_potential: SolarPotential | None = None,
-    ) -> EnergyEstimateResult:
-        """Calculate estimated energy usage for a residential building.
-
-        Energy Model:
-            Base Load = sqft × base_factor kWh/sqft/year
-            Cooling Load = cooling_sqft × CDD × cooling_efficiency / 1000
-            Heating Load = sqft × HDD × heating_efficiency / 1000
-            Total Annual = Base + Cooling + Heating - Solar_Offset
-        """
-        if cooling_sqft is None:
-            cooling_sqft = home_sqft
-
-        # Determine climate zone
-        zone_id = get_climate_zone(lat)
-        zone = CLIMATE_ZONES[zone_id]
-        cdd = zone["cdd"]
-        hdd = zone["hdd"]
-        rate = zone["rate"]
-
-        # Get efficiency factors
-        factors = EFFICIENCY_FACTORS[efficiency]
-
-        # Annual calculations
-        base_kwh = home_sqft * factors["base"]
-        cooling_kwh = cooling_sqft * cdd * factors["cooling"] / 1000
-        heating_kwh = home_sqft * hdd * factors["heating"] / 1000
-        total_annual = base_kwh + cooling_kwh + heating_kwh
-
-        logger.info(
-            "Energy estimate: %d sqft in zone %s — Base=%.0f, Cool=%.0f, Heat=%.0f, "
-            "Total=%.0f kWh/yr",
-            home_sqft, zone_id, base_kwh, cooling_kwh, heating_kwh, total_annual,
-        )
+    return CLIMATE_ZONES[climate_zone_index(lat)].id
+
+
+# Primary load labels, indexed by the batch estimate's primary-load matrix
+PRIMARY_LOADS = ("base", "cooling", "heating")
+
+# Efficiency levels in the order used by ``efficiency_idx`` in batch estimates
+EFFICIENCY_LEVELS: tuple[EfficiencyLevel, ...] = tuple(EFFICIENCY_FACTORS)
+
+
+@lru_cache(maxsize=1)
+def _batch_tables() -> tuple[np.ndarray, ...]:
+    """Lookup tables for batch estimates, built on first use.
+
+    Returns ``(cdd, hdd, base, cooling, heating, cdd_monthly, hdd_monthly)``:
+    degree days indexed by position in ``CLIMATE_ZONES``, efficiency factors
+    indexed by position in ``EFFICIENCY_LEVELS``, and the monthly shares.
+    """
+    import numpy as np
+
+    factors = [_EFFICIENCY_COEFFICIENTS[level] for level in EFFICIENCY_LEVELS]
+    return (
+        np.array([zone.cdd for zone in CLIMATE_ZONES], dtype=np.float64),
+        np.array([zone.hdd for zone in CLIMATE_ZONES], dtype=np.float64),
+        *(np.array([f[i] for f in factors], dtype=np.float64) for i in range(3)),
+        np.array([cdd for _, cdd, _ in _MONTHLY_FACTORS], dtype=np.float64),
+        np.array([hdd for _, _, hdd in _MONTHLY_FACTORS], dtype=np.float64),
+    )
 
-        # Monthly breakdown
-        monthly: list[MonthlyEnergy] = []
-        for month in MONTH_NAMES:
-            month_base = base_kwh / 12
-            month_cooling = cooling_kwh * MONTHLY_CDD_FACTORS[month]
-            month_heating = heating_kwh * MONTHLY_HDD_FACTORS[month]
-            month_total = month_base + month_cooling + month_heating
-
-            # Determine primary load for the month
-            if month_cooling > month_heating and month_cooling > month_base:
-                primary = "cooling"
-            elif month_heating > month_cooling and month_heating > month_base:
-                primary = "heating"
-            else:
-                primary = "base"
-
-            monthly.append(MonthlyEnergy(
-                month=month,
-                kwh=round(month_total, 1),
-                cost=round(month_total * rate, 2),
-                primary_load=primary,
-            ))
-
-        # Solar offset
-        if solar_potential and solar_potential.annual_production_kwh > 0:
-            solar_potential.offset_pct = round(
-                (solar_potential.annual_production_kwh / total_annual) * 100, 1
-            )
-
-        assumptions = EnergyAssumptions(
-            climate_zone=zone_id,
-            cdd=cdd,
-            hdd=hdd,
-            rate_per_kwh=rate,
-            efficiency_level=efficiency,
-            home_sqft=home_sqft,
-            cooling_sqft=cooling_sqft,
-        )
 
-        return EnergyEstimateResult(
-            annual_total_kwh=round(total_annual, 1),
-            annual_total_cost=round(total_annual * rate, 2),
-            annual_cooling_kwh=round(cooling_kwh, 1),
-            annual_heating_kwh=round(heating_kwh, 1),
-            annual_base_kwh=round(base_kwh, 1),
-            monthly=monthly,
-            solar_potential=solar_potential,
-            assumptions=assumptions,
+def estimate(
+    home_sqft: int,
+    cooling_sqft: int | None,
+    lat: float,
+    efficiency: EfficiencyLevel = EfficiencyLevel.STANDARD,
+    solar_potential: SolarPotential | None = None,
+) -> EnergyEstimateResult:
+    """Calculate estimated energy usage for a residential building.
+
+    Energy Model:
+        Base Load = sqft × base_factor kWh/sqft/year
+        Cooling Load = cooling_sqft × CDD × cooling_efficiency / 1000
+        Heating Load = sqft × HDD × heating_efficiency / 1000
+        Total Annual = Base + Cooling + Heating - Solar_Offset
+
+    The load calculation is memoized per (sqft, cooled sqft, climate zone,
+    efficiency) as plain data; each call validates it into fresh models, so
+    callers never share mutable state through the cache.
+    """
+    if cooling_sqft is None:
+        cooling_sqft = home_sqft
+
+    payload, total_annual = _estimate_loads(
+        home_sqft, cooling_sqft, climate_zone_index(lat), efficiency
+    )
+
+    # Solar offset
+    if solar_potential and solar_potential.annual_production_kwh > 0:
+        solar_potential.offset_pct = round(
+            (solar_potential.annual_production_kwh / total_annual) * 100, 1
         )
+
+    return EnergyEstimateResult.model_validate({**payload, "solar_potential": solar_potential})
+
+
+@lru_cache(maxsize=4096)
+def _estimate_loads(
+    home_sqft: int,
+    cooling_sqft: int,
+    zone_idx: int,
+    efficiency: EfficiencyLevel,
+) -> tuple[dict[str, Any], float]:
+    """Compute the solar-independent estimate and its unrounded annual total.
+
+    Returns the ``EnergyEstimateResult`` fields as plain data. The payload is
+    shared between calls through the cache and must not be mutated.
+    """
+    # Climate zone and the factors for this efficiency level
+    zone = CLIMATE_ZONES[zone_idx]
+    base_factor, cooling_factor, heating_factor = _EFFICIENCY_COEFFICIENTS[efficiency]
+    rate = zone.rate
+
+    # Annual calculations
+    base_kwh = home_sqft * base_factor
+    cooling_kwh = cooling_sqft * zone.cdd * cooling_factor / 1000
+    heating_kwh = home_sqft * zone.hdd * heating_factor / 1000
+    total_annual = base_kwh + cooling_kwh + heating_kwh
+
+    logger.debug(
+        "Energy estimate: %d sqft in zone %s — Base=%.0f, Cool=%.0f, Heat=%.0f, "
+        "Total=%.0f kWh/yr",
+        home_sqft, zone.id, base_kwh, cooling_kwh, heating_kwh, total_annual,
+    )
+
+    # Monthly breakdown; rows (like the assumptions) are validated into models
+    # in a single pass when the result is built from the payload
+    month_base = base_kwh / 12
+    monthly: list[dict[str, str | float]] = []
+    for month, cdd_factor, hdd_factor in _MONTHLY_FACTORS:
+        month_cooling = cooling_kwh * cdd_factor
+        month_heating = heating_kwh * hdd_factor
+        month_total = month_base + month_cooling + month_heating
+
+        # Determine primary load for the month
+        if month_cooling > month_heating and month_cooling > month_base:
+            primary = "cooling"
+        elif month_heating > month_cooling and month_heating > month_base:
+            primary = "heating"
+        else:
+            primary = "base"
+
+        monthly.append({
+            "month": month,
+            "kwh": round(month_total, 1),
+            "cost": round(month_total * rate, 2),
+            "primary_load": primary,
+        })
+
+    payload = {
+        "annual_total_kwh": round(total_annual, 1),
+        "annual_total_cost": round(total_annual * rate, 2),
+        "annual_cooling_kwh": round(cooling_kwh, 1),
+        "annual_heating_kwh": round(heating_kwh, 1),
+        "annual_base_kwh": round(base_kwh, 1),
+        "monthly": tuple(monthly),
+        "assumptions": {
+            "climate_zone": zone.id,
+            "cdd": zone.cdd,
+            "hdd": zone.hdd,
+            "rate_per_kwh": rate,
+            "efficiency_level": efficiency,
+            "home_sqft": home_sqft,
+            "cooling_sqft": cooling_sqft,
+        },
+    }
+    return payload, total_annual
+
+
+def estimate_many(
+    home_sqft: np.ndarray,
+    cooling_sqft: np.ndarray,
+    lat: np.ndarray,
+    efficiency_idx: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Estimate energy usage for a batch of parcels at once.
+
+    Uses the same model as :func:`estimate`, vectorized over parcels.
+    ``efficiency_idx`` indexes into ``EFFICIENCY_LEVELS``; pass
+    ``home_sqft`` as ``cooling_sqft`` where the cooled area is unknown.
+
+    Returns:
+        ``(monthly, annual, primary)``: an ``(N, 12)`` matrix of monthly
+        kWh, the ``(N,)`` annual totals, and an ``(N, 12)`` matrix of each
+        month's primary load as an index into ``PRIMARY_LOADS``. kWh values
+        are unrounded.
+    """
+    import numpy as np
+
+    cdd_tbl, hdd_tbl, base_tbl, cool_tbl, heat_tbl, cdd_monthly, hdd_monthly = _batch_tables()
+    home = np.asarray(home_sqft, dtype=np.float64)
+    cooling = np.asarray(cooling_sqft, dtype=np.float64)
+    zone_idx = np.searchsorted(_ZONE_LAT_BOUNDS, np.asarray(lat, dtype=np.float64), "right")
+    eff_idx = np.asarray(efficiency_idx, dtype=np.intp)
+
+    base_kwh = home * base_tbl[eff_idx]
+    cooling_kwh = cooling * cdd_tbl[zone_idx] * cool_tbl[eff_idx] / 1000
+    heating_kwh = home * hdd_tbl[zone_idx] * heat_tbl[eff_idx] / 1000
+
+    month_base = np.broadcast_to((base_kwh / 12)[:, None], (len(base_kwh), 12))
+    month_cooling = np.outer(cooling_kwh, cdd_monthly)
+    month_heating = np.outer(heating_kwh, hdd_monthly)
+    monthly = month_base + month_cooling + month_heating
+
+    # Indices into PRIMARY_LOADS, with estimate()'s tie-break: a load is
+    # primary only when strictly larger than both others, otherwise base
+    primary = np.select(
+        (
+            (month_cooling > month_heating) & (month_cooling > month_base),
+            (month_heating > month_cooling) & (month_heating > month_base),
+        ),
+        (1, 2),
+        0,
+    )
+
+    return monthly, base_kwh + cooling_kwh + heating_kwh, primary
@@ -2,68 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any
 
-import httpx
+import orjson
 from google import genai
 from google.genai import types
+from pydantic import ValidationError
 
 from src.config import get_settings
 from src.models import (
+    PLACED_STRUCTURES_ADAPTER,
     ContextData,
-    DetectedStructure,
     ParcelAnalysisResult,
     ParcelFeatures,
     PlacedStructure,
     SiteLayout,
     StructureType,
 )
+from src.services import _http, _singleflight
+from src.services._ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
+_settings = get_settings()
 
+# Satellite tiles for a location rarely change; keep recent ones (~50 MB max)
+SATELLITE_CACHE_SIZE = 256
+SATELLITE_CACHE_TTL = 3600.0
 
-class GeminiService:
-    """Service for Google Gemini AI interactions."""
+SatelliteKey = tuple[float, float, int, str]
 
-    def __init__(self, api_key: str | None = None) -> None:
-        settings = get_settings()
-        self.api_key = api_key or settings.google_gemini_api_key
-        self.client = genai.Client(api_key=self.api_key)
-        self.maps_api_key = settings.google_maps_api_key
+# Zoning, climate and soil context rarely changes; cache it per address on a
+# ~100 m grid. The address is part of the key because the prompt asks for
+# address-specific answers and address-only requests share default coordinates.
+CONTEXT_CACHE_SIZE = 1024
+CONTEXT_CACHE_TTL = 86400.0
 
-    async def get_satellite_image(
-        self, lat: float, lng: float, zoom: int = 20, size: str = "640x640"
-    ) -> bytes:
-        """Fetch satellite imagery from Google Maps Static API."""
-        url = "https://maps.googleapis.com/maps/api/staticmap"
-        params = {
-            "center": f"{lat},{lng}",
-            "zoom": zoom,
-            "size": size,
-            "maptype": "satellite",
-            "key": self.maps_api_key,
-        }
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.content
-
-    async def analyze_parcel(
-        self,
-        satellite_image: bytes,
-        address: str,
-        lat: float,
-        lng: float,
-    ) -> ParcelAnalysisResult:
-        """Analyze a parcel using Gemini 2.5 Flash Image Understanding."""
-        logger.info("Analyzing parcel at %s (%.4f, %.4f)", address, lat, lng)
+ContextKey = tuple[float, float, str]
 
-        # Step 1: Image analysis with Gemini Vision
-        image_part = types.Part.from_bytes(data=satellite_image, mime_type="image/png")
+# One line per placed structure in the visualization prompt; %s keeps the
+# values formatted exactly as str() would
+_STRUCTURE_LINE = "- %s: %ssqft at (%s, %s), %s×%sft"
 
-        analysis_prompt = """Analyze this satellite image of a residential parcel.
+# Static vision prompt, wrapped in a Part once so the SDK reuses it as-is
+_ANALYSIS_PROMPT = """Analyze this satellite image of a residential parcel.
 Return a JSON object with these fields:
 {
   "parcel_boundary": [[y1,x1], [y2,x2], ...],  // polygon coords normalized 0-1000
@@ -83,61 +66,10 @@ Return a JSON object with these fields:
 }
 
 Be precise with bounding boxes. If you cannot determine a value, use reasonable defaults for a Florida residential lot."""
+_ANALYSIS_PROMPT_PART = types.Part.from_text(text=_ANALYSIS_PROMPT)
 
-        try:
-            response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=[image_part, analysis_prompt],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.1,
-                ),
-            )
-
-            # Parse the JSON response
-            analysis_data = json.loads(response.text)
-            logger.info("Parcel analysis complete: %d structures detected",
-                        len(analysis_data.get("existing_structures", [])))
-
-            # Build ParcelFeatures from response
-            existing_structures = [
-                DetectedStructure(**s) for s in analysis_data.get("existing_structures", [])
-            ]
-
-            parcel_features = ParcelFeatures(
-                parcel_boundary=analysis_data.get("parcel_boundary", []),
-                existing_structures=existing_structures,
-                vegetation_areas=analysis_data.get("vegetation_areas", []),
-                access_points=analysis_data.get("access_points", []),
-                orientation_deg=analysis_data.get("orientation_deg", 0),
-                usable_area_sqft=analysis_data.get("usable_area_sqft", 0),
-                estimated_dimensions=analysis_data.get("estimated_dimensions", {}),
-                setback_estimate=analysis_data.get(
-                    "setback_estimate", {"front_ft": 25, "side_ft": 10, "rear_ft": 20}
-                ),
-            )
-
-        except Exception as e:
-            logger.error("Gemini image analysis failed: %s", e)
-            # Return reasonable defaults so the pipeline continues
-            parcel_features = ParcelFeatures(
-                usable_area_sqft=10000,
-                estimated_dimensions={"width_ft": 100, "depth_ft": 100},
-            )
-
-        # Step 2: Context data from Maps Grounding
-        context_data = await self._get_maps_context(address, lat, lng)
-
-        return ParcelAnalysisResult(
-            parcel_features=parcel_features,
-            context_data=context_data,
-        )
-
-    async def _get_maps_context(
-        self, address: str, lat: float, lng: float
-    ) -> ContextData:
-        """Get location-aware context using Gemini Maps Grounding."""
-        context_prompt = f"""For the property at {address} (lat: {lat}, lng: {lng}):
+# Prompts below are filled in with str.format, so literal JSON braces are doubled
+_CONTEXT_PROMPT = """For the property at {address} (lat: {lat}, lng: {lng}):
 Return a JSON object with:
 {{
   "zoning": "residential single-family / residential multi-family / agricultural / etc",
@@ -152,21 +84,130 @@ Return a JSON object with:
 
 Use your knowledge of this location. Be specific to this address."""
 
-        try:
-            response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=context_prompt,
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_maps=types.GoogleMaps())],
-                    response_mime_type="application/json",
-                    temperature=0.2,
-                ),
-            )
-            context = json.loads(response.text)
-            return ContextData(**context)
-        except Exception as e:
-            logger.warning("Maps grounding failed, using defaults: %s", e)
-            return ContextData(
+_LAYOUT_PROMPT = """You are a site planning expert. Generate an optimal layout for these structures on a parcel.
+
+PARCEL INFO:
+- Dimensions: {lot_width}ft wide × {lot_depth}ft deep
+- Usable area: {usable_area_sqft} sqft
+- Orientation: {orientation_deg}° from north
+- Setbacks: front={front_ft}ft, side={side_ft}ft, rear={rear_ft}ft
+- Climate zone: {climate_zone}
+- Prevailing wind: {prevailing_wind}
+- Existing structures: {existing_count}
+
+DESIRED STRUCTURES:
+{structures_block}
+
+LAYOUT RULES (prioritized):
+1. Solar Orientation: Long axis of home E-W for max southern exposure
+2. Drainage: Place structures on high ground
+3. Access Efficiency: Minimize driveway length
+4. Wind Protection: Garage/shed as windbreak on prevailing wind side
+5. Privacy: Bedrooms away from street
+6. Fire Safety: Defensible space from trees
+7. Garden: South-facing, protected from frost
+8. Future Expansion: Leave room for additions
+
+Return JSON:
+{{
+  "structures": [
+    {{
+      "type": "home|detached_garage|shed|garden|fence|driveway|patio",
+      "footprint_sqft": 0,
+      "total_sqft": 0,
+      "stories": 1,
+      "position": {{"x": 0, "y": 0}},
+      "rotation_deg": 0,
+      "dimensions": {{"width_ft": 0, "depth_ft": 0}},
+      "reason": "explanation"
+    }}
+  ],
+  "setbacks": {{"front_ft": 25, "side_ft": 10, "rear_ft": 20}},
+  "lot_coverage_pct": 0,
+  "usable_yard_sqft": 0,
+  "driveway_length_ft": 0,
+  "fence_linear_ft": 0,
+  "optimization_notes": ["note1", "note2"]
+}}
+
+Position uses feet from the northwest corner of the lot. Rotation is clockwise from north."""
+
+
+class GeminiService:
+    """Service for Google Gemini AI interactions."""
+
+    __slots__ = ("api_key", "client", "maps_api_key", "_satellite_cache", "_context_cache")
+
+    def __init__(self, api_key: str | None = None) -> None:
+        self.api_key = api_key or _settings.google_gemini_api_key
+        self.client = genai.Client(api_key=self.api_key)
+        self.maps_api_key = _settings.google_maps_api_key
+        self._satellite_cache = TTLCache[SatelliteKey, bytes](
+            SATELLITE_CACHE_SIZE, SATELLITE_CACHE_TTL
+        )
+        self._context_cache = TTLCache[ContextKey, ContextData](
+            CONTEXT_CACHE_SIZE, CONTEXT_CACHE_TTL
+        )
+
+    async def aclose(self) -> None:
+        """Close the SDK's async HTTP connection pool."""
+        await self.client.aio.aclose()
+
+    async def get_satellite_image(
+        self, lat: float, lng: float, zoom: int = 20, size: str = "640x640"
+    ) -> bytes:
+        """Fetch satellite imagery from Google Maps Static API.
+
+        Recent tiles are cached per location, and concurrent requests for the
+        same tile share one download.
+        """
+        key = (round(lat, 6), round(lng, 6), zoom, size)
+        cached = self._satellite_cache.get(key)
+        if cached is not None:
+            return cached
+
+        return await _singleflight.do(
+            ("satellite", id(self), key), lambda: self._fetch_satellite_image(key)
+        )
+
+    async def _fetch_satellite_image(self, key: SatelliteKey) -> bytes:
+        lat, lng, zoom, size = key
+        url = "https://maps.googleapis.com/maps/api/staticmap"
+        params = {
+            "center": f"{lat},{lng}",
+            "zoom": zoom,
+            "size": size,
+            "maptype": "satellite",
+            "key": self.maps_api_key,
+        }
+        # Streamed so error responses are rejected before their body is read;
+        # aread() then buffers the PNG once and Part.from_bytes uses it as-is
+        async with _http.get_client().stream("GET", url, params=params) as response:
+            response.raise_for_status()
+            image = await response.aread()
+
+        self._satellite_cache.set(key, image)
+        return image
+
+    async def analyze_parcel(
+        self, address: str, lat: float, lng: float
+    ) -> ParcelAnalysisResult:
+        """Analyze a parcel from satellite imagery and location context.
+
+        Image analysis (satellite fetch, then Gemini vision) and Maps
+        grounding are independent, so both run concurrently. A failed
+        satellite fetch is raised; failed model calls fall back to defaults.
+        """
+        features, context = await asyncio.gather(
+            self._analyze_satellite(address, lat, lng),
+            self._get_maps_context(address, lat, lng),
+            return_exceptions=True,
+        )
+        if isinstance(features, BaseException):
+            raise features
+        if isinstance(context, BaseException):
+            logger.warning("Maps grounding failed, using defaults: %s", context)
+            context = ContextData(
                 zoning="residential single-family",
                 climate_zone="2A",
                 avg_temp_high_f=82,
@@ -177,6 +218,81 @@ Use your knowledge of this location. Be specific to this address."""
                 nearby_utilities=["electric", "water"],
             )
 
+        return ParcelAnalysisResult(parcel_features=features, context_data=context)
+
+    async def _analyze_satellite(self, address: str, lat: float, lng: float) -> ParcelFeatures:
+        """Fetch the parcel's satellite tile and analyze it with Gemini 2.5 Flash."""
+        satellite_image = await self.get_satellite_image(lat, lng, zoom=20)
+        logger.info("Satellite image acquired: %d bytes", len(satellite_image))
+        logger.debug("Analyzing parcel at %s (%.4f, %.4f)", address, lat, lng)
+
+        image_part = types.Part.from_bytes(data=satellite_image, mime_type="image/png")
+
+        try:
+            return await self._run_vision(image_part, _ANALYSIS_PROMPT_PART)
+        except Exception as e:
+            logger.error("Gemini image analysis failed: %s", e)
+            # Return reasonable defaults so the pipeline continues
+            return ParcelFeatures(
+                usable_area_sqft=10000,
+                estimated_dimensions={"width_ft": 100, "depth_ft": 100},
+            )
+
+    async def _run_vision(self, image_part: types.Part, prompt: types.Part) -> ParcelFeatures:
+        """Run image understanding on ``image_part`` and parse the detected features."""
+        response = await self.client.aio.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=[image_part, prompt],
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                temperature=0.1,
+            ),
+        )
+
+        # Parse and validate in one pass; fields missing from the response
+        # take the ParcelFeatures defaults
+        features = ParcelFeatures.model_validate_json(response.text)
+        logger.info("Parcel analysis complete: %d structures detected",
+                    len(features.existing_structures))
+        return features
+
+    async def _get_maps_context(
+        self, address: str, lat: float, lng: float
+    ) -> ContextData:
+        """Get location-aware context using Gemini Maps Grounding.
+
+        Results are cached per normalized address on a ~100 m grid, and
+        concurrent lookups for the same key share one call. Failures are not
+        cached. Each caller gets its own copy, as with the solar cache.
+        """
+        key = (round(lat, 3), round(lng, 3), " ".join(address.casefold().split()))
+        context = self._context_cache.get(key)
+        if context is None:
+            context = await _singleflight.do(
+                ("context", id(self), key),
+                lambda: self._fetch_maps_context(key, address, lat, lng),
+            )
+        return context.model_copy(deep=True)
+
+    async def _fetch_maps_context(
+        self, key: ContextKey, address: str, lat: float, lng: float
+    ) -> ContextData:
+        context_prompt = _CONTEXT_PROMPT.format(address=address, lat=lat, lng=lng)
+
+        response = await self.client.aio.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=context_prompt,
+            config=types.GenerateContentConfig(
+                tools=[types.Tool(google_maps=types.GoogleMaps())],
+                response_mime_type="application/json",
+                temperature=0.2,
+            ),
+        )
+        context = ContextData.model_validate_json(response.text)
+
+        self._context_cache.set(key, context)
+        return context
+
     async def generate_layout(
         self,
         parcel_features: ParcelFeatures,
@@ -189,7 +305,7 @@ Use your knowledge of this location. Be specific to this address."""
         fence_type: str = "privacy",
     ) -> SiteLayout:
         """Generate optimal site layout using Gemini AI."""
-        logger.info("Generating layout for %d structures on %.0f sqft parcel",
+        logger.debug("Generating layout for %d structures on %.0f sqft parcel",
                      len(desired_structures), parcel_features.usable_area_sqft)
 
         dims = parcel_features.estimated_dimensions
@@ -213,56 +329,22 @@ Use your knowledge of this location. Be specific to this address."""
             else:
                 structures_desc.append(f"{s.value}")
 
-        layout_prompt = f"""You are a site planning expert. Generate an optimal layout for these structures on a parcel.
-
-PARCEL INFO:
-- Dimensions: {lot_width}ft wide × {lot_depth}ft deep
-- Usable area: {parcel_features.usable_area_sqft} sqft
-- Orientation: {parcel_features.orientation_deg}° from north
-- Setbacks: front={setbacks.get('front_ft', 25)}ft, side={setbacks.get('side_ft', 10)}ft, rear={setbacks.get('rear_ft', 20)}ft
-- Climate zone: {context_data.climate_zone}
-- Prevailing wind: {context_data.prevailing_wind}
-- Existing structures: {len(parcel_features.existing_structures)}
-
-DESIRED STRUCTURES:
-{chr(10).join(f"- {s}" for s in structures_desc)}
-
-LAYOUT RULES (prioritized):
-1. Solar Orientation: Long axis of home E-W for max southern exposure
-2. Drainage: Place structures on high ground
-3. Access Efficiency: Minimize driveway length
-4. Wind Protection: Garage/shed as windbreak on prevailing wind side
-5. Privacy: Bedrooms away from street
-6. Fire Safety: Defensible space from trees
-7. Garden: South-facing, protected from frost
-8. Future Expansion: Leave room for additions
-
-Return JSON:
-{{
-  "structures": [
-    {{
-      "type": "home|detached_garage|shed|garden|fence|driveway|patio",
-      "footprint_sqft": 0,
-      "total_sqft": 0,
-      "stories": 1,
-      "position": {{"x": 0, "y": 0}},
-      "rotation_deg": 0,
-      "dimensions": {{"width_ft": 0, "depth_ft": 0}},
-      "reason": "explanation"
-    }}
-  ],
-  "setbacks": {{"front_ft": 25, "side_ft": 10, "rear_ft": 20}},
-  "lot_coverage_pct": 0,
-  "usable_yard_sqft": 0,
-  "driveway_length_ft": 0,
-  "fence_linear_ft": 0,
-  "optimization_notes": ["note1", "note2"]
-}}
-
-Position uses feet from the northwest corner of the lot. Rotation is clockwise from north."""
+        layout_prompt = _LAYOUT_PROMPT.format(
+            lot_width=lot_width,
+            lot_depth=lot_depth,
+            usable_area_sqft=parcel_features.usable_area_sqft,
+            orientation_deg=parcel_features.orientation_deg,
+            front_ft=setbacks.get("front_ft", 25),
+            side_ft=setbacks.get("side_ft", 10),
+            rear_ft=setbacks.get("rear_ft", 20),
+            climate_zone=context_data.climate_zone,
+            prevailing_wind=context_data.prevailing_wind,
+            existing_count=len(parcel_features.existing_structures),
+            structures_block="\n".join(f"- {s}" for s in structures_desc),
+        )
 
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=layout_prompt,
                 config=types.GenerateContentConfig(
@@ -270,15 +352,19 @@ Position uses feet from the northwest corner of the lot. Rotation is clockwise f
                     temperature=0.3,
                 ),
             )
-            layout_data = json.loads(response.text)
-
-            structures = []
-            for s in layout_data.get("structures", []):
-                try:
-                    s["type"] = StructureType(s["type"])
-                    structures.append(PlacedStructure(**s))
-                except (ValueError, KeyError) as err:
-                    logger.warning("Skipping invalid structure: %s", err)
+            layout_data = orjson.loads(response.text)
+
+            raw_structures = layout_data.get("structures", [])
+            try:
+                structures = PLACED_STRUCTURES_ADAPTER.validate_python(raw_structures)
+            except ValidationError:
+                # Fall back to per-item validation so one bad entry doesn't drop the rest
+                structures = []
+                for s in raw_structures:
+                    try:
+                        structures.append(PlacedStructure.model_validate(s))
+                    except ValidationError as err:
+                        logger.warning("Skipping invalid structure: %s", err)
 
             return SiteLayout(
                 structures=structures,
@@ -308,13 +394,17 @@ Position uses feet from the northwest corner of the lot. Rotation is clockwise f
         layout takes precedence.
         """
         if layout and layout.structures:
-            structures_desc = "\n".join(
-                f"- {s.type.value}: {s.footprint_sqft}sqft at "
-                f"({s.position.get('x', 0)}, {s.position.get('y', 0)}), "
-                f"{s.dimensions.get('width_ft', 0)}×"
-                f"{s.dimensions.get('depth_ft', 0)}ft"
+            structures_desc = "\n".join([
+                _STRUCTURE_LINE % (
+                    s.type.value,
+                    s.footprint_sqft,
+                    s.position.get("x", 0),
+                    s.position.get("y", 0),
+                    s.dimensions.get("width_ft", 0),
+                    s.dimensions.get("depth_ft", 0),
+                )
                 for s in layout.structures
-            )
+            ])
         elif layout_description:
             structures_desc = layout_description
         else:
@@ -335,7 +425,7 @@ Requirements:
 - Professional architectural rendering quality"""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model="gemini-2.5-flash-preview-image-generation",
                 contents=viz_prompt,
                 config=types.GenerateContentConfig(
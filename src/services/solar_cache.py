@@ -0,0 +1,132 @@
+"""In-process stale-while-revalidate cache for Google Solar API lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import orjson
+
+from src.models import SolarPotential
+from src.services import _singleflight
+from src.services._ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SolarFetcher = Callable[[], Awaitable[SolarPotential | None]]
+
+
+class SolarCache:
+    """LRU cache of solar potential keyed on a ~11 m lat/lng grid.
+
+    Entries older than ``ttl`` are still served immediately while a single
+    background task refreshes them. Concurrent misses for the same key share
+    one upstream call. Fetchers return ``None`` when the API has no data;
+    those results are never cached so the service can recover on its own.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 86400.0) -> None:
+        # Wall-clock timestamps, since entries are persisted across restarts
+        self._entries = TTLCache[str, SolarPotential](maxsize, ttl, clock=time.time)
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def ttl(self) -> float:
+        """Age in seconds after which an entry is refreshed in the background."""
+        return self._entries.ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._entries.ttl = value
+
+    @staticmethod
+    def key(lat: float, lng: float) -> str:
+        """Quantize coordinates to 4 decimal places (~11 m)."""
+        return f"{round(lat, 4)}:{round(lng, 4)}"
+
+    async def get_or_fetch(
+        self, lat: float, lng: float, fetch: SolarFetcher
+    ) -> SolarPotential | None:
+        """Return a copy of the cached value, fetching it on a miss."""
+        key = self.key(lat, lng)
+        hit = self._entries.lookup(key)
+        if hit is None:
+            value = await _singleflight.do(("solar", id(self), key), lambda: self._fill(key, fetch))
+            if value is None:
+                return None
+        else:
+            value, expired = hit
+            if expired and key not in self._refreshing:
+                self._refreshing.add(key)
+                task = asyncio.create_task(self._refresh(key, fetch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        # Callers (e.g. the energy estimate) fill in fields like offset_pct
+        return value.model_copy()
+
+    async def _fill(self, key: str, fetch: SolarFetcher) -> SolarPotential | None:
+        value = await fetch()
+        if value is not None:
+            self._entries.set(key, value)
+        return value
+
+    async def _refresh(self, key: str, fetch: SolarFetcher) -> None:
+        try:
+            value = await fetch()
+            if value is not None:
+                self._entries.set(key, value)
+        except Exception as e:
+            logger.warning("Solar cache refresh failed for %s: %s", key, e)
+        finally:
+            self._refreshing.discard(key)
+
+    def load(self, path: Path) -> None:
+        """Load entries previously written by :meth:`save`, if the file exists."""
+        try:
+            raw = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Could not load solar cache from %s: %s", path, e)
+            return
+
+        if not isinstance(raw, list):
+            logger.warning("Ignoring solar cache at %s: unexpected format", path)
+            return
+
+        skipped = 0
+        for item in raw[-self._entries.maxsize:]:
+            # Entries written by an older release may no longer match the schema
+            try:
+                key, stored_at, value = item
+                if not isinstance(key, str):
+                    raise TypeError(f"key must be a string, got {key!r}")
+                self._entries.set(
+                    key, SolarPotential.model_validate(value), stored_at=float(stored_at)
+                )
+            except (TypeError, ValueError) as e:
+                skipped += 1
+                logger.debug("Skipping solar cache entry: %s", e)
+        logger.info(
+            "Loaded %d solar cache entries from %s (%d skipped)",
+            len(self._entries), path, skipped,
+        )
+
+    def save(self, path: Path) -> None:
+        """Write entries to ``path`` as JSON, oldest first."""
+        payload = [
+            (key, stored_at, value.model_dump())
+            for key, stored_at, value in self._entries.items()
+        ]
+        try:
+            path.write_bytes(orjson.dumps(payload))
+        except OSError as e:
+            logger.warning("Could not save solar cache to %s: %s", path, e)
@@ -3,23 +3,41 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from pathlib import Path
 
 import httpx
+import orjson
 
 from src.config import get_settings
 from src.models import SolarPotential
+from src.services import _http
+from src.services.solar_cache import SolarCache
 
 logger = logging.getLogger(__name__)
+_settings = get_settings()
+
+_M2_TO_SQFT = 10.763910417
 
 
 class SolarService:
     """Service for Google Solar API interactions."""
 
+    __slots__ = ("api_key", "cache", "cache_path")
+
     BASE_URL = "https://solar.googleapis.com/v1"
 
     def __init__(self, api_key: str | None = None) -> None:
-        settings = get_settings()
-        self.api_key = api_key or settings.google_solar_api_key
+        self.api_key = api_key or _settings.google_solar_api_key
+        self.cache = SolarCache()
+        self.cache_path = Path(_settings.solar_cache_path) if _settings.solar_cache_path else None
+        if self.cache_path:
+            self.cache.load(self.cache_path)
+
+    async def aclose(self) -> None:
+        """Persist the lookup cache."""
+        if self.cache_path:
+            self.cache.save(self.cache_path)
 
     async def get_building_insights(
         self, lat: float, lng: float, quality: str = "HIGH"
@@ -33,32 +51,45 @@ class SolarService:
             "key": self.api_key,
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                logger.info(
+        try:
+            response = await _http.get_client().get(url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
                     "Solar API: Got building insights for (%.4f, %.4f) - "
                     "max sunshine: %.0f hrs/yr",
                     lat, lng,
                     data.get("solarPotential", {}).get("maxSunshineHoursPerYear", 0),
                 )
-                return data
-            except httpx.HTTPStatusError as e:
-                logger.warning("Solar API error %d: %s", e.response.status_code, e.response.text)
-                return {}
-            except Exception as e:
-                logger.error("Solar API request failed: %s", e)
-                return {}
+            return data
+        except httpx.HTTPStatusError as e:
+            logger.warning("Solar API error %d: %s", e.response.status_code, e.response.text)
+            return {}
+        except Exception as e:
+            logger.error("Solar API request failed: %s", e)
+            return {}
 
     async def get_solar_potential(self, lat: float, lng: float) -> SolarPotential:
-        """Get solar potential analysis for a location."""
-        data = await self.get_building_insights(lat, lng)
+        """Get solar potential analysis for a location.
 
-        if not data or "solarPotential" not in data:
+        API results are cached per location; estimates used when the API has
+        no data are not, so a later request can still pick up real data.
+        """
+        result = await self.cache.get_or_fetch(
+            lat, lng, lambda: self._fetch_solar_potential(lat, lng)
+        )
+        if result is None:
             logger.warning("No solar data available for (%.4f, %.4f), using estimates", lat, lng)
             return self._estimate_solar_potential(lat)
+        return result
+
+    async def _fetch_solar_potential(self, lat: float, lng: float) -> SolarPotential | None:
+        """Fetch solar potential from the API, or ``None`` if it has no data."""
+        data = await self.get_building_insights(lat, lng)
+
+        if not data or "solarPotential" not in data:
+            return None
 
         solar = data["solarPotential"]
         panel_configs = solar.get("solarPanelConfigs", [])
@@ -74,9 +105,9 @@ class SolarService:
 
         # Calculate roof area from segments
         roof_segments = solar.get("roofSegmentStats", [])
-        total_roof_sqft = sum(
-            seg.get("stats", {}).get("areaMeters2", 0) * 10.764  # m² to sqft
-            for seg in roof_segments
+        total_roof_sqft = (
+            sum(seg.get("stats", {}).get("areaMeters2", 0) for seg in roof_segments)
+            * _M2_TO_SQFT
         )
 
         sunshine_hours = solar.get("maxSunshineHoursPerYear", 0)
@@ -95,26 +126,36 @@ class SolarService:
         )
 
     def _estimate_solar_potential(self, lat: float) -> SolarPotential:
-        """Estimate solar potential when API data isn't available."""
-        # Use latitude-based estimation for Florida
-        # Peak sun hours roughly: 5.5 (N FL) to 6.0 (S FL)
-        peak_sun_hours = 5.5 + (30 - lat) * 0.1  # Rough approximation
-        peak_sun_hours = max(4.5, min(6.5, peak_sun_hours))
-
-        # Assume standard 2400 sqft home = ~600 sqft usable roof for solar
-        usable_roof_sqft = 600
-        panel_sqft = 17.5  # Average residential panel
-        max_panels = int(usable_roof_sqft / panel_sqft)
-        watts_per_panel = 400
-        system_kw = max_panels * watts_per_panel / 1000
-
-        annual_kwh = system_kw * peak_sun_hours * 365 * 0.80  # 80% system efficiency
-
-        return SolarPotential(
-            max_panels=max_panels,
-            annual_production_kwh=annual_kwh,
-            offset_pct=0,
-            estimated_savings_annual=annual_kwh * 0.13,
-            sunshine_hours_per_year=peak_sun_hours * 365,
-            roof_area_sqft=usable_roof_sqft,
-        )
+        """Estimate solar potential when API data isn't available.
+
+        The estimate depends only on latitude, so it is memoized on a ~1 km
+        grid; callers get a copy since they fill in ``offset_pct``.
+        """
+        return _estimate_for_latitude(round(lat, 2)).model_copy()
+
+
+@lru_cache(maxsize=1024)
+def _estimate_for_latitude(lat: float) -> SolarPotential:
+    """Estimate solar potential when API data isn't available."""
+    # Use latitude-based estimation for Florida
+    # Peak sun hours roughly: 5.5 (N FL) to 6.0 (S FL)
+    peak_sun_hours = 5.5 + (30 - lat) * 0.1  # Rough approximation
+    peak_sun_hours = max(4.5, min(6.5, peak_sun_hours))
+
+    # Assume standard 2400 sqft home = ~600 sqft usable roof for solar
+    usable_roof_sqft = 600
+    panel_sqft = 17.5  # Average residential panel
+    max_panels = int(usable_roof_sqft / panel_sqft)
+    watts_per_panel = 400
+    system_kw = max_panels * watts_per_panel / 1000
+
+    annual_kwh = system_kw * peak_sun_hours * 365 * 0.80  # 80% system efficiency
+
+    return SolarPotential(
+        max_panels=max_panels,
+        annual_production_kwh=annual_kwh,
+        offset_pct=0,
+        estimated_savings_annual=annual_kwh * 0.13,
+        sunshine_hours_per_year=peak_sun_hours * 365,
+        roof_area_sqft=usable_roof_sqft,
+    )
@@ -2,89 +2,134 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
+import numpy as np
+
 from src.models import EfficiencyLevel, SolarPotential
-from src.services.energy_service import EnergyService
+from src.services import energy_service
+from src.services.energy_service import EFFICIENCY_LEVELS, PRIMARY_LOADS
 
 
 def test_estimate_basic_energy() -> None:
     """Basic energy estimation returns valid results."""
-    svc = EnergyService()
-    result = svc.estimate(
-        cooled_sqft=1800.0,
+    result = energy_service.estimate(
+        home_sqft=1800,
+        cooling_sqft=None,
         lat=28.5,
-        lng=-81.4,
         efficiency=EfficiencyLevel.STANDARD,
         solar_potential=None,
-        include_solar=False,
     )
 
-    assert result.annual_kwh > 0
-    assert result.monthly_avg_kwh > 0
-    assert len(result.monthly_breakdown) == 12
+    assert result.annual_total_kwh > 0
+    assert result.annual_total_cost > 0
+    assert len(result.monthly) == 12
     assert result.assumptions is not None
+    assert result.assumptions.cooling_sqft == 1800
 
 
 def test_estimate_with_solar_offset() -> None:
-    """Energy estimate with solar reduces total consumption."""
-    svc = EnergyService()
-
-    # Without solar
-    no_solar = svc.estimate(
-        cooled_sqft=2000.0,
-        lat=28.5,
-        lng=-81.4,
-        efficiency=EfficiencyLevel.STANDARD,
-        solar_potential=None,
-        include_solar=False,
+    """Energy estimate with solar reports the offset against total usage."""
+    solar = SolarPotential(max_panels=20, annual_production_kwh=9000.0)
+    with_solar = energy_service.estimate(
+        2000, None, 28.5, EfficiencyLevel.STANDARD, solar_potential=solar
     )
 
-    # With solar
-    solar = SolarPotential(
-        max_panel_count=20,
-        panel_capacity_watts=400,
-        yearly_kwh_per_kw=1600.0,
-        max_array_area_sqft=350.0,
-    )
-    with_solar = svc.estimate(
-        cooled_sqft=2000.0,
-        lat=28.5,
-        lng=-81.4,
-        efficiency=EfficiencyLevel.STANDARD,
-        solar_potential=solar,
-        include_solar=True,
-    )
+    assert with_solar.solar_potential is not None
+    assert with_solar.solar_potential.offset_pct > 0
+
+
+def test_cached_estimates_do_not_share_solar() -> None:
+    """Repeated estimates for the same home keep their own solar potential."""
+    solar = SolarPotential(annual_production_kwh=9000.0)
+    with_solar = energy_service.estimate(2200, None, 27.0, solar_potential=solar)
+    without_solar = energy_service.estimate(2200, None, 27.0)
 
-    assert with_solar.solar_offset_pct > 0
-    assert with_solar.annual_kwh < no_solar.annual_kwh
+    assert with_solar.solar_potential is solar
+    assert without_solar.solar_potential is None
+    assert with_solar.annual_total_kwh == without_solar.annual_total_kwh
+
+
+def test_cached_estimates_do_not_share_models() -> None:
+    """Mutating one estimate does not leak into later cached estimates."""
+    first = energy_service.estimate(2300, None, 29.0)
+    first.monthly[0].kwh = -1.0
+    first.monthly.clear()
+    assert first.assumptions is not None
+    first.assumptions.home_sqft = 0
+
+    second = energy_service.estimate(2300, None, 29.0)
+
+    assert len(second.monthly) == 12
+    assert second.monthly[0].kwh > 0
+    assert second.assumptions is not None
+    assert second.assumptions.home_sqft == 2300
 
 
 def test_efficiency_levels_affect_consumption() -> None:
     """Higher efficiency results in lower energy usage."""
-    svc = EnergyService()
-
-    standard = svc.estimate(1800, 28.5, -81.4, EfficiencyLevel.STANDARD)
-    high = svc.estimate(1800, 28.5, -81.4, EfficiencyLevel.HIGH)
+    standard = energy_service.estimate(1800, None, 28.5, EfficiencyLevel.STANDARD)
+    efficient = energy_service.estimate(1800, None, 28.5, EfficiencyLevel.EFFICIENT)
 
-    assert high.annual_kwh < standard.annual_kwh
+    assert efficient.annual_total_kwh < standard.annual_total_kwh
 
 
 def test_climate_zone_detection() -> None:
     """Climate zone correctly identified by latitude."""
-    svc = EnergyService()
-
     # South Florida (Zone 1A)
-    assert svc.get_climate_zone(25.7) == "1A"
+    assert energy_service.get_climate_zone(25.7) == "1A"
     # Central Florida (Zone 2A)
-    assert svc.get_climate_zone(28.5) == "2A"
+    assert energy_service.get_climate_zone(28.5) == "2A"
     # North Florida (Zone 3A)
-    assert svc.get_climate_zone(30.5) == "3A"
+    assert energy_service.get_climate_zone(30.5) == "3A"
 
 
 def test_monthly_breakdown_sums_to_annual() -> None:
     """Monthly breakdown values should approximately sum to annual."""
-    svc = EnergyService()
-    result = svc.estimate(1800, 28.5, -81.4, EfficiencyLevel.STANDARD)
+    result = energy_service.estimate(1800, None, 28.5, EfficiencyLevel.STANDARD)
 
-    monthly_sum = sum(m.kwh for m in result.monthly_breakdown)
+    monthly_sum = sum(m.kwh for m in result.monthly)
     # Allow 5% tolerance for rounding
-    assert abs(monthly_sum - result.annual_kwh) / result.annual_kwh < 0.05
+    assert abs(monthly_sum - result.annual_total_kwh) / result.annual_total_kwh < 0.05
+
+
+def test_estimate_many_matches_estimate() -> None:
+    """Batch estimates agree with per-parcel estimates."""
+    home = [1500, 2400, 3200]
+    cooling = [1500, 2000, 3200]
+    lats = [25.7, 28.5, 30.5]
+    eff_idx = [0, 1, 2]
+
+    monthly, annual, primary = energy_service.estimate_many(home, cooling, lats, eff_idx)
+
+    assert monthly.shape == (3, 12)
+    assert primary.shape == (3, 12)
+    for i in range(3):
+        result = energy_service.estimate(
+            home[i], cooling[i], lats[i], EFFICIENCY_LEVELS[eff_idx[i]]
+        )
+        assert round(float(annual[i]), 1) == result.annual_total_kwh
+        assert [round(kwh, 1) for kwh in monthly[i].tolist()] == [m.kwh for m in result.monthly]
+        assert [PRIMARY_LOADS[j] for j in primary[i]] == [m.primary_load for m in result.monthly]
+
+
+def test_estimate_many_tie_break_matches_estimate() -> None:
+    """Equal cooling and heating loads above base count as base, as in estimate()."""
+    tables = (
+        np.full(3, 1000.0), np.full(3, 1000.0),  # cdd, hdd
+        np.zeros(3), np.ones(3), np.ones(3),  # base, cooling, heating factors
+        np.full(12, 1 / 12), np.full(12, 1 / 12),  # monthly cdd, hdd shares
+    )
+    with mock.patch.object(energy_service, "_batch_tables", return_value=tables):
+        _, _, primary = energy_service.estimate_many([2000], [2000], [28.5], [1])
+
+    assert [PRIMARY_LOADS[j] for j in primary[0]] == ["base"] * 12
+
+
+def test_monthly_costs_match_reference_values() -> None:
+    """Loads are evaluated in the model's order, so rounded costs stay stable."""
+    result = energy_service.estimate(500, 2400, 26.5, EfficiencyLevel.POOR)
+    costs = {m.month: m.cost for m in result.monthly}
+
+    assert costs["March"] == 58.70
+    assert costs["October"] == 55.58
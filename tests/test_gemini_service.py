@@ -0,0 +1,51 @@
+"""Tests for Gemini service caching."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import orjson
+
+from src.services.gemini_service import GeminiService
+
+
+async def test_maps_context_cache_is_per_address() -> None:
+    """Different addresses at the same coordinates get their own context."""
+    gemini = GeminiService(api_key="test")
+    prompts: list[str] = []
+
+    async def generate(**kwargs: Any) -> SimpleNamespace:
+        prompts.append(kwargs["contents"])
+        return SimpleNamespace(text=orjson.dumps({"zoning": f"zone {len(prompts)}"}).decode())
+
+    with mock.patch.object(gemini.client.aio.models, "generate_content", side_effect=generate):
+        miami = await gemini._get_maps_context("Miami Beach, FL", 29.7147, -81.5036)
+        pensacola = await gemini._get_maps_context("Pensacola, FL", 29.7147, -81.5036)
+        miami_again = await gemini._get_maps_context(" miami beach,  FL", 29.7147, -81.5036)
+
+    assert len(prompts) == 2
+    assert miami.zoning == "zone 1"
+    assert pensacola.zoning == "zone 2"
+    assert miami_again.zoning == "zone 1"
+
+
+
+async def test_maps_context_cache_returns_copies() -> None:
+    """Callers may mutate cached context without affecting later lookups."""
+    gemini = GeminiService(api_key="test")
+    payload = orjson.dumps({"zoning": "RS-1", "nearby_utilities": ["electric"]}).decode()
+    response = SimpleNamespace(text=payload)
+
+    with mock.patch.object(
+        gemini.client.aio.models, "generate_content", return_value=response
+    ) as generate:
+        first = await gemini._get_maps_context("Ocala, FL", 29.19, -82.14)
+        first.zoning = "changed"
+        first.nearby_utilities.append("gas")
+        second = await gemini._get_maps_context("Ocala, FL", 29.19, -82.14)
+
+    generate.assert_awaited_once()
+    assert second.zoning == "RS-1"
+    assert second.nearby_utilities == ["electric"]
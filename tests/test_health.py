@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -30,6 +32,25 @@ def test_health_contains_timestamp() -> None:
     assert "T" in data["timestamp"]  # ISO format check
 
 
+def test_ready_returns_503_before_startup() -> None:
+    """Readiness probe fails until the lifespan warmup has completed."""
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+
+def test_ready_returns_200_after_warmup() -> None:
+    """Readiness probe succeeds once services are warmed."""
+    with TestClient(app) as started:
+        for _ in range(100):
+            response = started.get("/health/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
 def test_openapi_docs_available() -> None:
     """OpenAPI docs are accessible."""
     response = client.get("/openapi.json")
@@ -43,3 +43,35 @@ def test_templates_contain_required_fields() -> None:
     for template in templates:
         missing = required_fields - set(template.keys())
         assert not missing, f"Template {template.get('name')} missing: {missing}"
+
+
+def test_templates_not_modified_with_matching_etag() -> None:
+    """Templates endpoint honours If-None-Match with a 304."""
+    response = client.get("/api/v1/layouts/templates")
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/v1/layouts/templates", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+
+def test_templates_etag_is_weak_across_encodings() -> None:
+    """The gzip and identity bodies share a weak tag, and either form revalidates."""
+    gzipped = client.get("/api/v1/layouts/templates", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/api/v1/layouts/templates", headers={"Accept-Encoding": "identity"})
+    etag = plain.headers["etag"]
+
+    assert etag.startswith('W/"')
+    assert gzipped.headers["etag"] == etag
+    for tag in (etag, etag.removeprefix("W/")):
+        cached = client.get("/api/v1/layouts/templates", headers={"If-None-Match": tag})
+        assert cached.status_code == 304
+
+
+def test_templates_are_gzip_compressed() -> None:
+    """Large JSON responses are gzip-encoded when the client accepts it."""
+    response = client.get("/api/v1/layouts/templates", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) >= 8
@@ -0,0 +1,51 @@
+"""Tests for service singleton lifecycle."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.services import _build_gemini_service, close_services, get_gemini_service
+from src.services.gemini_service import GeminiService
+
+
+async def test_close_services_closes_gemini_client() -> None:
+    """Shutdown closes the SDK client of a Gemini service that was built."""
+    _build_gemini_service.cache_clear()
+    gemini = GeminiService(api_key="test")
+
+    with (
+        mock.patch("src.services.gemini_service.GeminiService", return_value=gemini),
+        mock.patch.object(gemini.client.aio, "aclose") as aclose,
+    ):
+        assert get_gemini_service() is gemini
+        await close_services()
+
+    aclose.assert_awaited_once()
+    assert _build_gemini_service.cache_info().currsize == 0
+
+
+def test_concurrent_getters_build_one_service() -> None:
+    """Callers racing the startup warmup share a single instance."""
+    _build_gemini_service.cache_clear()
+    builds = 0
+    lock = threading.Lock()
+
+    def slow_build() -> object:
+        nonlocal builds
+        with lock:
+            builds += 1
+        time.sleep(0.05)
+        return object()
+
+    with (
+        mock.patch("src.services.gemini_service.GeminiService", side_effect=slow_build),
+        ThreadPoolExecutor(max_workers=4) as pool,
+    ):
+        services = list(pool.map(lambda _: get_gemini_service(), range(4)))
+
+    _build_gemini_service.cache_clear()
+    assert builds == 1
+    assert all(service is services[0] for service in services)
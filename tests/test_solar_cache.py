@@ -0,0 +1,127 @@
+"""Tests for the Solar API stale-while-revalidate cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import orjson
+
+from src.models import SolarPotential
+from src.services.solar_cache import SolarCache
+
+
+def _counting_fetcher(
+    calls: list[int], kwh: float = 9000.0
+) -> Callable[[], Awaitable[SolarPotential]]:
+    async def fetch() -> SolarPotential:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return SolarPotential(max_panels=20, annual_production_kwh=kwh)
+
+    return fetch
+
+
+async def test_concurrent_misses_share_one_fetch() -> None:
+    """Identical concurrent lookups collapse into a single upstream call."""
+    cache = SolarCache()
+    calls: list[int] = []
+    fetch = _counting_fetcher(calls)
+
+    results = await asyncio.gather(
+        *(cache.get_or_fetch(29.71471, -81.50361, fetch) for _ in range(5))
+    )
+
+    assert len(calls) == 1
+    assert all(r is not None and r.max_panels == 20 for r in results)
+
+
+async def test_returns_copies_of_cached_value() -> None:
+    """Callers may mutate results without corrupting the cache."""
+    cache = SolarCache()
+    fetch = _counting_fetcher([])
+
+    first = await cache.get_or_fetch(29.7, -81.5, fetch)
+    assert first is not None
+    first.offset_pct = 99.0
+
+    second = await cache.get_or_fetch(29.7, -81.5, fetch)
+    assert second is not None
+    assert second.offset_pct == 0.0
+
+
+async def test_stale_entry_served_while_refreshing() -> None:
+    """Expired entries are returned immediately and refreshed in the background."""
+    cache = SolarCache(ttl=0.0)
+    calls: list[int] = []
+
+    await cache.get_or_fetch(29.7, -81.5, _counting_fetcher(calls, kwh=1000.0))
+    stale = await cache.get_or_fetch(29.7, -81.5, _counting_fetcher(calls, kwh=2000.0))
+    assert stale is not None
+    assert stale.annual_production_kwh == 1000.0
+
+    await asyncio.sleep(0.05)
+    cache.ttl = 3600.0
+    fresh = await cache.get_or_fetch(29.7, -81.5, _counting_fetcher(calls))
+    assert fresh is not None
+    assert fresh.annual_production_kwh == 2000.0
+    assert len(calls) == 2
+
+
+async def test_missing_data_is_not_cached() -> None:
+    """Fetchers returning None are retried on the next lookup."""
+    cache = SolarCache()
+    calls: list[int] = []
+
+    async def no_data() -> None:
+        calls.append(1)
+
+    assert await cache.get_or_fetch(29.7, -81.5, no_data) is None
+    assert await cache.get_or_fetch(29.7, -81.5, no_data) is None
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+async def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """Persisted entries are served after reload without a fetch."""
+    path = tmp_path / "solar-cache.json"
+    cache = SolarCache()
+    await cache.get_or_fetch(29.7, -81.5, _counting_fetcher([]))
+    cache.save(path)
+
+    reloaded = SolarCache()
+    reloaded.load(path)
+    calls: list[int] = []
+    result = await reloaded.get_or_fetch(29.7, -81.5, _counting_fetcher(calls))
+
+    assert result is not None
+    assert result.max_panels == 20
+    assert calls == []
+
+
+def test_load_skips_malformed_entries(tmp_path: Path) -> None:
+    """Bad or schema-drifted entries are skipped instead of failing the load."""
+    path = tmp_path / "solar-cache.json"
+    path.write_bytes(orjson.dumps([
+        ["29.7:-81.5", 1.0, {"max_panels": 20}],
+        ["29.8:-81.5", 1.0, {"max_panels": "many"}],
+        ["29.9:-81.5", 1.0],
+        42,
+    ]))
+
+    cache = SolarCache()
+    cache.load(path)
+
+    assert len(cache) == 1
+
+
+def test_load_ignores_unexpected_top_level_shape(tmp_path: Path) -> None:
+    """A valid JSON file that isn't an entry list is treated as no cache."""
+    path = tmp_path / "solar-cache.json"
+    path.write_bytes(orjson.dumps({"entries": []}))
+
+    cache = SolarCache()
+    cache.load(path)
+
+    assert len(cache) == 0
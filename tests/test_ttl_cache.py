@@ -0,0 +1,40 @@
+"""Tests for the shared expiring LRU cache."""
+
+from __future__ import annotations
+
+from src.services._ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Expired entries are reported by lookup and hidden by get."""
+    clock = _Clock()
+    cache = TTLCache[str, int](maxsize=4, ttl=10.0, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.0
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert cache.lookup("a") == (1, True)
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Reads refresh recency, so the untouched entry is evicted first."""
+    cache = TTLCache[str, int](maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert [key for key, _, _ in cache.items()] == ["a", "c"]